@@ -0,0 +1,10 @@
+"""
+Benchmark suite for the Inventory Management System.
+
+Run `python -m benchmarks --help` for the available commands:
+
+    seed     Fill the database with a deterministic data set
+    orm      Time the ORM hot paths (checkout, alert scan, dashboard, report export)
+    load     Drive the WSGI application in-process or over HTTP
+    compare  Compare two result files and flag regressions
+"""
@@ -0,0 +1,199 @@
+"""
+Command-line entry point: python -m benchmarks <command> [options]
+
+Examples:
+    python -m benchmarks seed --products 100000 --sales 200000 --movements 300000 --anchor 2026-01-31
+    python -m benchmarks orm --iterations 100
+    python -m benchmarks load --path /en/dashboard/ --login --requests 2000 --concurrency 16
+    python -m benchmarks load --url http://127.0.0.1:8000 --path /en/dashboard/ --login
+    python -m benchmarks compare benchmarks/results/orm-old.json benchmarks/results/orm-new.json
+"""
+
+import argparse
+import sys
+from datetime import date
+
+from . import results
+from .environment import setup_django
+from .seed import BENCH_USERNAME
+
+
+def print_comparison(rows, regressions, threshold):
+    """Print a comparison table and a summary of the regressions."""
+    print(f"{'benchmark':<28}{'metric':<16}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, metric, before, after, change in rows:
+        print(f"{name:<28}{metric:<16}{before:>12}{after:>12}{change:>+9.1f}%")
+    if regressions:
+        print(f"\n✗ {len(regressions)} regression(s) worse than {threshold:.0f}%:")
+        for name, metric, before, after, change in regressions:
+            print(f"  {name} {metric}: {before} -> {after} ({change:+.1f}%)")
+    else:
+        print(f"\n✓ No regressions worse than {threshold:.0f}%")
+
+
+def finish(kind, params, run_results, args):
+    """Save the results and compare them with the baseline when one is given."""
+    path = results.save(kind, params, run_results, args.output)
+    print(f"\nResults written to {path}")
+    if args.baseline:
+        print(f"\n=== COMPARISON WITH {args.baseline} ===")
+        rows, regressions = results.compare(results.load(args.baseline), results.load(path), args.threshold)
+        print_comparison(rows, regressions, args.threshold)
+        if regressions:
+            return 1
+    return 0
+
+
+def cmd_seed(args):
+    from . import seed
+
+    setup_django()
+    if args.flush:
+        print("Removing previously seeded data...")
+        seed.flush()
+    params = {key: getattr(args, key) for key in (
+        'products', 'categories', 'suppliers', 'sales', 'items_per_sale', 'movements', 'days', 'seed', 'batch_size',
+        'anchor',
+    )}
+    try:
+        summary = seed.seed(**params)
+    except RuntimeError as e:
+        print(f"✗ {e}")
+        return 1
+    # Record the anchor actually used so the run can be reproduced
+    params['anchor'] = summary['anchor']
+    return finish('seed', params, summary, args)
+
+
+def cmd_orm(args):
+    from . import orm
+
+    setup_django()
+    print("=== ORM HOT PATHS ===")
+    try:
+        run_results = orm.run(args.benchmarks, args.iterations, args.warmup)
+    except RuntimeError as e:
+        print(f"✗ {e}")
+        return 1
+    params = {'benchmarks': args.benchmarks or list(orm.BENCHMARKS), 'iterations': args.iterations, 'warmup': args.warmup}
+    return finish('orm', params, run_results, args)
+
+
+def cmd_load(args):
+    from . import loadgen
+
+    setup_django()
+    from django.core.exceptions import ObjectDoesNotExist
+
+    try:
+        cookie = loadgen.login_cookie(BENCH_USERNAME) if args.login else None
+    except ObjectDoesNotExist:
+        print(f"✗ No \"{BENCH_USERNAME}\" user found; run `python -m benchmarks seed` first")
+        return 1
+
+    mode = f"HTTP {args.url}" if args.url else 'in-process app:application'
+    print(f"=== LOAD: {mode}, {args.requests} requests x {args.concurrency} clients ===")
+
+    run_results = {}
+    for path in args.path:
+        try:
+            if args.url:
+                request = loadgen.http_requester(args.url, path, cookie)
+            else:
+                request = loadgen.wsgi_requester(path, cookie)
+            result = loadgen.run(request, args.requests, args.concurrency, args.warmup)
+        except Exception as e:
+            print(f"✗ {path}: could not run the load (setup or warmup failed): {type(e).__name__}: {e}")
+            return 1
+        run_results[path] = result
+        print(f"  {path:<30} {result['throughput_rps']:>8.1f} req/s  p50 {result['p50_ms']:>8.2f} ms  "
+              f"p95 {result['p95_ms']:>8.2f} ms  p99 {result['p99_ms']:>8.2f} ms  {result['errors']} errors")
+        if result['first_error']:
+            print(f"    first error: {result['first_error']}")
+        if result['redirects']:
+            print(f"  ⚠ {path} answered {result['redirects']} request(s) with a redirect, so the redirect is "
+                  "being measured rather than the page; use --login or request the final URL")
+        if result['count'] == 0:
+            print(f"✗ {path}: no request completed, not saving results")
+            return 1
+        error_rate = result['errors'] / args.requests * 100
+        if error_rate > args.max_error_rate:
+            print(f"✗ {path}: {error_rate:.1f}% of requests failed (limit {args.max_error_rate:.1f}%, "
+                  f"statuses {result['status_counts']}), not saving results")
+            return 1
+
+    params = {
+        'mode': 'http' if args.url else 'wsgi', 'url': args.url, 'paths': args.path, 'login': args.login,
+        'requests': args.requests, 'concurrency': args.concurrency, 'warmup': args.warmup,
+        'max_error_rate': args.max_error_rate,
+    }
+    return finish('load', params, run_results, args)
+
+
+def cmd_compare(args):
+    rows, regressions = results.compare(results.load(args.baseline), results.load(args.current), args.threshold)
+    print_comparison(rows, regressions, args.threshold)
+    return 1 if regressions else 0
+
+
+def add_output_arguments(parser):
+    parser.add_argument('--output', help='Result file (default: benchmarks/results/<kind>-<time>.json)')
+    parser.add_argument('--baseline', help='Earlier result file to compare against')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Regression threshold in percent')
+
+
+def main():
+    from .orm import BENCHMARKS
+
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Inventory Management System benchmarks')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    seed_parser = subparsers.add_parser('seed', help='Fill the database with deterministic benchmark data')
+    seed_parser.add_argument('--products', type=int, default=10000)
+    seed_parser.add_argument('--categories', type=int, default=50)
+    seed_parser.add_argument('--suppliers', type=int, default=200)
+    seed_parser.add_argument('--sales', type=int, default=50000)
+    seed_parser.add_argument('--items-per-sale', type=int, default=5, help='Maximum lines per sale')
+    seed_parser.add_argument('--movements', type=int, default=0, help='Extra stock adjustment movements')
+    seed_parser.add_argument('--days', type=int, default=365, help='Days of history to spread sales over')
+    seed_parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    seed_parser.add_argument('--anchor', type=date.fromisoformat,
+                             help='Last day of the seeded history, YYYY-MM-DD (default: today)')
+    seed_parser.add_argument('--batch-size', type=int, default=5000)
+    seed_parser.add_argument('--flush', action='store_true', help='Remove previously seeded data first')
+    add_output_arguments(seed_parser)
+    seed_parser.set_defaults(func=cmd_seed)
+
+    orm_parser = subparsers.add_parser('orm', help='Time the ORM hot paths')
+    orm_parser.add_argument('--benchmarks', nargs='+', choices=list(BENCHMARKS), help='Benchmarks to run (default: all)')
+    orm_parser.add_argument('--iterations', type=int, default=50)
+    orm_parser.add_argument('--warmup', type=int, default=3)
+    add_output_arguments(orm_parser)
+    orm_parser.set_defaults(func=cmd_orm)
+
+    load_parser = subparsers.add_parser('load', help='Drive the WSGI application with concurrent requests')
+    load_parser.add_argument('--path', action='append', help='URL path to request (repeatable, default: /en/dashboard/)')
+    load_parser.add_argument('--url', help='Base URL of a running server; omit to call app:application in-process')
+    load_parser.add_argument('--login', action='store_true', help=f'Send requests as the seeded "{BENCH_USERNAME}" user')
+    load_parser.add_argument('--requests', type=int, default=1000)
+    load_parser.add_argument('--concurrency', type=int, default=8)
+    load_parser.add_argument('--warmup', type=int, default=50)
+    load_parser.add_argument('--max-error-rate', type=float, default=1.0,
+                             help='Fail the run when more than this percentage of requests fail (default: 1)')
+    add_output_arguments(load_parser)
+    load_parser.set_defaults(func=cmd_load)
+
+    compare_parser = subparsers.add_parser('compare', help='Compare two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=10.0, help='Regression threshold in percent')
+    compare_parser.set_defaults(func=cmd_compare)
+
+    args = parser.parse_args()
+    if args.command == 'load' and not args.path:
+        args.path = ['/en/dashboard/']
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Django setup and run metadata for the benchmark commands.
+"""
+
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+project_dir = Path(__file__).resolve().parent.parent
+
+
+def setup_django():
+    """Configure Django the same way manage.py and the WSGI module do."""
+    if str(project_dir) not in sys.path:
+        sys.path.insert(0, str(project_dir))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'inventory_management.settings')
+    import django
+    django.setup()
+
+
+def git_commit():
+    """Return the current git commit, or None outside a checkout."""
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=project_dir, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def run_metadata():
+    """Describe the machine and code a benchmark ran on."""
+    metadata = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+    if 'django' in sys.modules:
+        from django.conf import settings
+        if settings.configured:
+            from django.db import connection
+            metadata['django'] = sys.modules['django'].get_version()
+            metadata['database'] = connection.vendor
+    return metadata
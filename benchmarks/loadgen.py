@@ -0,0 +1,136 @@
+"""
+Load generator for the WSGI application.
+
+In-process mode imports `app:application` and calls it directly from a pool of
+threads, which measures Django and the database without any network or server
+overhead. HTTP mode sends keep-alive requests to a running server (for example
+Gunicorn started with gunicorn.conf.py) so the whole stack is measured.
+"""
+
+import http.client
+import io
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from wsgiref.util import setup_testing_defaults
+
+from .environment import project_dir
+from .stats import summarize
+
+
+def login_cookie(username):
+    """Return a session cookie header for `username`, created without a login request."""
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.test import Client
+
+    client = Client()
+    client.force_login(get_user_model().objects.get(username=username))
+    return f"{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}"
+
+
+def wsgi_requester(path, cookie=None):
+    """Return a function that sends one GET to app:application in-process."""
+    if str(project_dir) not in sys.path:
+        sys.path.insert(0, str(project_dir))
+    from app import application
+
+    path, _, query = path.partition('?')
+
+    def request():
+        environ = {'PATH_INFO': path, 'QUERY_STRING': query, 'REQUEST_METHOD': 'GET', 'wsgi.input': io.BytesIO()}
+        if cookie:
+            environ['HTTP_COOKIE'] = cookie
+        setup_testing_defaults(environ)
+        status = []
+        body = application(environ, lambda s, headers, exc_info=None: status.append(s))
+        try:
+            for _ in body:
+                pass
+        finally:
+            if hasattr(body, 'close'):
+                body.close()
+        return int(status[0].split(' ', 1)[0])
+
+    return request
+
+
+def http_requester(base_url, path, cookie=None):
+    """Return a function that sends one GET over a per-thread keep-alive connection."""
+    url = urlsplit(base_url)
+    connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+    headers = {'Cookie': cookie} if cookie else {}
+    local = threading.local()
+
+    def request():
+        if getattr(local, 'conn', None) is None:
+            local.conn = connection_class(url.hostname, url.port, timeout=30)
+        try:
+            local.conn.request('GET', path, headers=headers)
+            response = local.conn.getresponse()
+            response.read()
+            return response.status
+        except (OSError, http.client.HTTPException):
+            local.conn.close()
+            local.conn = None
+            raise
+
+    return request
+
+
+def run(request, total_requests=1000, concurrency=8, warmup=50):
+    """Send total_requests requests from `concurrency` threads and summarize them.
+
+    Exceptions raised during the warmup propagate. During the measured run,
+    exceptions and responses with status 400 or above are counted as errors
+    and left out of the latencies; the first one is reported as `first_error`.
+    `status_counts` and `redirects` show what the server actually answered.
+    """
+    for _ in range(warmup):
+        request()
+
+    latencies, errors = [], 0
+    first_error = None
+    statuses = Counter()
+    lock = threading.Lock()
+    remaining = iter(range(total_requests))
+
+    def worker():
+        nonlocal errors, first_error
+        local, local_errors, local_statuses = [], 0, Counter()
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    break
+            started = time.perf_counter()
+            try:
+                status = request()
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            else:
+                local_statuses[status] += 1
+                if status < 400:
+                    local.append(time.perf_counter() - started)
+                    continue
+                error = f"HTTP {status}"
+            local_errors += 1
+            with lock:
+                if first_error is None:
+                    first_error = error
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+            statuses.update(local_statuses)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+    result = summarize(latencies, time.perf_counter() - started, errors)
+    result['first_error'] = first_error
+    result['status_counts'] = {str(status): count for status, count in sorted(statuses.items())}
+    result['redirects'] = sum(count for status, count in statuses.items() if 300 <= status < 400)
+    return result
@@ -0,0 +1,152 @@
+"""
+Micro-benchmarks for the ORM hot paths.
+
+The ims sources are not part of this tree, so these are synthetic stand-ins
+written against the ims models. They approximate the queries of the code path
+they are named after, but can drift from it; once the ims views and tasks are
+available, the benchmarks should call them instead:
+
+    checkout       Create a sale with its items and 'out' movements and decrement stock
+    alert_scan     Find low-stock products and products expiring soon
+    dashboard      Compute the dashboard totals, sales figures and top sellers
+    report_export  Stream the last 30 days of sale lines into a CSV file
+
+Checkouts run inside a transaction that is rolled back, so repeated runs see
+the same data.
+"""
+
+import csv
+import io
+import random
+from datetime import timedelta
+
+from .seed import BENCH_CUSTOMER, get_benchmark_user
+from .stats import time_calls
+
+EXPIRY_WARNING_DAYS = 7
+REPORT_DAYS = 30
+
+
+def alert_scan():
+    """Low-stock and expiry scans, modelled on check_inventory_alerts."""
+    from django.db.models import F
+    from django.utils import timezone
+    from ims.models import Product
+
+    today = timezone.localdate()
+    low_stock = list(Product.objects.filter(quantity__lt=F('reorder_level')).values_list('pk', 'quantity'))
+    expiring = list(Product.objects.filter(
+        expiry_date__isnull=False, expiry_date__lte=today + timedelta(days=EXPIRY_WARNING_DAYS),
+    ).values_list('pk', 'expiry_date'))
+    return len(low_stock) + len(expiring)
+
+
+def dashboard():
+    """The aggregates shown on the dashboard."""
+    from django.db.models import Count, DecimalField, ExpressionWrapper, F, Sum
+    from django.utils import timezone
+    from ims.models import Product, Sale, SaleItem
+
+    today = timezone.localdate()
+    stock_value = ExpressionWrapper(F('price') * F('quantity'), output_field=DecimalField())
+    totals = Product.objects.aggregate(products=Count('pk'), stock_value=Sum(stock_value))
+    low_stock = Product.objects.filter(quantity__lt=F('reorder_level')).count()
+    sales_today = Sale.objects.filter(date__date=today).aggregate(total=Sum('total_amount'), count=Count('pk'))
+    sales_month = Sale.objects.filter(date__date__gte=today.replace(day=1)).aggregate(total=Sum('total_amount'))
+    top_sellers = list(
+        SaleItem.objects.values('product_id', 'product__name')
+        .annotate(sold=Sum('quantity')).order_by('-sold')[:5]
+    )
+    return totals, low_stock, sales_today, sales_month, top_sellers
+
+
+def report_export():
+    """Write the recent sale lines of a sales report to CSV."""
+    from django.utils import timezone
+    from ims.models import SaleItem
+
+    since = timezone.now() - timedelta(days=REPORT_DAYS)
+    rows = (
+        SaleItem.objects.filter(sale__date__gte=since)
+        .values_list('sale_id', 'sale__date', 'product__name', 'quantity', 'price')
+        .iterator(chunk_size=2000)
+    )
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(['Sale', 'Date', 'Product', 'Quantity', 'Price'])
+    for row in rows:
+        writer.writerow(row)
+    return output.tell()
+
+
+def make_checkout(seed=42, max_lines=5):
+    """Return a function that performs one checkout and rolls it back."""
+    from django.db import transaction
+    from django.db.models import F
+    from ims.models import Product, Sale, SaleItem, StockMovement
+
+    rng = random.Random(seed)
+    user = get_benchmark_user()
+    in_stock = list(Product.objects.filter(quantity__gte=max_lines).values_list('pk', 'price')[:10000])
+    if not in_stock:
+        raise RuntimeError("No products with stock; run `python -m benchmarks seed` first")
+
+    def checkout():
+        lines = [(rng.choice(in_stock), rng.randint(1, max_lines)) for _ in range(rng.randint(1, max_lines))]
+        with transaction.atomic():
+            sale = Sale.objects.create(
+                customer_name=BENCH_CUSTOMER, customer_email='', customer_phone='',
+                total_amount=sum(price * quantity for (_, price), quantity in lines), created_by=user,
+            )
+            SaleItem.objects.bulk_create(
+                SaleItem(sale=sale, product_id=product_id, quantity=quantity, price=price)
+                for (product_id, price), quantity in lines
+            )
+            for (product_id, _), quantity in lines:
+                Product.objects.filter(pk=product_id).update(quantity=F('quantity') - quantity)
+            StockMovement.objects.bulk_create(
+                StockMovement(
+                    product_id=product_id, movement_type='out', quantity=quantity,
+                    notes=f"Sold in sale #{sale.pk}", created_by=user,
+                ) for (product_id, _), quantity in lines
+            )
+            transaction.set_rollback(True)
+
+    return checkout
+
+
+# Factories returning the function to time, so setup work is not measured
+BENCHMARKS = {
+    'checkout': make_checkout,
+    'alert_scan': lambda: alert_scan,
+    'dashboard': lambda: dashboard,
+    'report_export': lambda: report_export,
+}
+
+
+def run(names=None, iterations=50, warmup=3, log=print):
+    """Run the selected benchmarks and return their latency summaries."""
+    from django.db import connection
+
+    results = {}
+    for name in names or BENCHMARKS:
+        func = BENCHMARKS[name]()
+        counter = _QueryCounter()
+        with connection.execute_wrapper(counter):
+            result = time_calls(func, iterations, warmup)
+        result['queries_per_call'] = round(counter.count / (iterations + warmup), 1)
+        results[name] = result
+        log(f"  {name:<14} p50 {result['p50_ms']:>9.2f} ms  p95 {result['p95_ms']:>9.2f} ms  "
+            f"p99 {result['p99_ms']:>9.2f} ms  {result['queries_per_call']} queries")
+    return results
+
+
+class _QueryCounter:
+    """Database execute wrapper that counts the queries it sees."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
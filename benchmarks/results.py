@@ -0,0 +1,58 @@
+"""
+Saving benchmark runs as JSON and comparing them to flag regressions.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from .environment import project_dir, run_metadata
+
+RESULTS_DIR = project_dir / 'benchmarks' / 'results'
+
+# Metrics where a higher value is worse; for throughput a lower value is worse
+LATENCY_METRICS = ('p50_ms', 'p95_ms', 'p99_ms')
+THROUGHPUT_METRIC = 'throughput_rps'
+
+
+def save(kind, params, results, path=None):
+    """Write a run to `path` (default: benchmarks/results/<kind>-<time>.json)."""
+    run = {'kind': kind, 'metadata': run_metadata(), 'params': params, 'results': results}
+    if path is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        path = RESULTS_DIR / f"{kind}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    path = Path(path)
+    with open(path, 'w') as f:
+        json.dump(run, f, indent=2, default=str)
+        f.write('\n')
+    return path
+
+
+def load(path):
+    """Read a run written by save()."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(baseline, current, threshold=10.0):
+    """Compare two runs benchmark by benchmark.
+
+    Returns (rows, regressions). Each row is (benchmark, metric, baseline,
+    current, change in percent); a regression is a row that got worse by more
+    than `threshold` percent.
+    """
+    rows, regressions = [], []
+    for name, before in baseline['results'].items():
+        after = current['results'].get(name)
+        if not isinstance(before, dict) or not isinstance(after, dict):
+            continue
+        for metric in LATENCY_METRICS + (THROUGHPUT_METRIC,):
+            if metric not in before or metric not in after or not before[metric]:
+                continue
+            change = (after[metric] - before[metric]) / before[metric] * 100
+            row = (name, metric, before[metric], after[metric], round(change, 1))
+            rows.append(row)
+            worse = -change if metric == THROUGHPUT_METRIC else change
+            if worse > threshold:
+                regressions.append(row)
+    return rows, regressions
@@ -0,0 +1,240 @@
+"""
+Deterministic data seeder for the benchmarks.
+
+The same seed, sizes and anchor date always produce the same catalogue, sales
+and stock movements, so results from different runs are comparable. The data
+keeps the stock invariant the application maintains: every product's quantity
+equals its 'in' movements minus its 'out' movements, and no sale oversells,
+because the initial stock movement is sized to cover everything sold or
+adjusted out afterwards.
+
+Seeded names and barcodes start with the reserved "__bench__" prefix, and
+seeded sales belong to the "benchmark" user. --flush only deletes sales owned
+by that user, products with the reserved barcode prefix, and reserved-prefix
+categories and suppliers that no other product still uses.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, time as dt_time, timedelta
+from decimal import Decimal
+
+BENCH_PREFIX = '__bench__'
+BENCH_CUSTOMER = f'{BENCH_PREFIX} Customer'
+BENCH_USERNAME = 'benchmark'
+
+
+@contextmanager
+def explicit_dates(*models):
+    """Let bulk_create keep the dates we set on auto_now_add 'date' fields."""
+    fields = [model._meta.get_field('date') for model in models]
+    saved = [(field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, (auto_now, auto_now_add) in zip(fields, saved):
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def batched(iterable, size):
+    """Yield lists of at most `size` items."""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def get_benchmark_user():
+    """Return the superuser that owns every seeded sale and movement.
+
+    The user has no usable password, so nobody can log in as it; the load
+    generator authenticates it with force_login instead.
+    """
+    from django.contrib.auth import get_user_model
+
+    user, created = get_user_model().objects.get_or_create(
+        username=BENCH_USERNAME,
+        defaults={'email': 'benchmark@example.com', 'is_staff': True, 'is_superuser': True},
+    )
+    if created:
+        user.set_unusable_password()
+        user.save(update_fields=['password'])
+    return user
+
+
+def flush():
+    """Delete everything a previous seed run created."""
+    from django.contrib.auth import get_user_model
+    from ims.models import Category, Product, Sale, Supplier
+
+    # Sales first: their items and movements reference the seeded products
+    user = get_user_model().objects.filter(username=BENCH_USERNAME).first()
+    if user is not None:
+        Sale.objects.filter(created_by=user, customer_name=BENCH_CUSTOMER).delete()
+    Product.objects.filter(barcode__startswith=BENCH_PREFIX, name__startswith=BENCH_PREFIX).delete()
+    # Never cascade into products that are not part of the benchmark data
+    Category.objects.filter(name__startswith=BENCH_PREFIX).exclude(
+        pk__in=Product.objects.values('category_id')).delete()
+    Supplier.objects.filter(name__startswith=BENCH_PREFIX).exclude(
+        pk__in=Product.objects.values('supplier_id')).delete()
+
+
+def seed(products=10000, categories=50, suppliers=200, sales=50000, items_per_sale=5,
+         movements=0, days=365, seed=42, batch_size=5000, anchor=None, log=print):
+    """Create a deterministic data set and return row counts and timings."""
+    from django.db import transaction
+    from django.utils import timezone
+    from ims.models import Category, Product, Sale, SaleItem, StockMovement, Supplier
+
+    if Product.objects.filter(barcode__startswith=BENCH_PREFIX).exists():
+        raise RuntimeError("The database already contains seeded data; use --flush to replace it")
+
+    rng = random.Random(seed)
+    anchor = anchor or timezone.localdate()
+    # Sales and movements are spread over the `days` days ending at the anchor
+    end = timezone.make_aware(datetime.combine(anchor, dt_time.max))
+    span_seconds = days * 86400
+    user = get_benchmark_user()
+    counts, timings = {}, {}
+
+    def phase(name):
+        timings[name] = time.perf_counter()
+
+    def done(name, model, count):
+        elapsed = time.perf_counter() - timings[name]
+        timings[name] = round(elapsed, 3)
+        counts[model] = count
+        log(f"  {model}: {count} rows in {elapsed:.1f}s ({count / elapsed if elapsed else 0:.0f} rows/s)")
+
+    def random_date():
+        # Strictly after the initial stock movement at the start of the span
+        return end - timedelta(seconds=rng.randint(0, span_seconds - 1))
+
+    log("Seeding benchmark data...")
+
+    phase('categories')
+    category_ids = [c.pk for c in Category.objects.bulk_create(
+        Category(name=f"{BENCH_PREFIX} Category {i}", description='') for i in range(categories)
+    )]
+    done('categories', 'categories', len(category_ids))
+
+    phase('suppliers')
+    supplier_ids = [s.pk for s in Supplier.objects.bulk_create(
+        Supplier(
+            name=f"{BENCH_PREFIX} Supplier {i}", contact_person=f"Contact {i}",
+            email=f"supplier{i}@example.com", phone=f"+250{i:09d}", address='',
+        ) for i in range(suppliers)
+    )]
+    done('suppliers', 'suppliers', len(supplier_ids))
+
+    def product_rows():
+        for i in range(products):
+            has_expiry = rng.random() < 0.2
+            yield Product(
+                name=f"{BENCH_PREFIX} Product {i}", description='',
+                category_id=rng.choice(category_ids), supplier_id=rng.choice(supplier_ids),
+                price=Decimal(rng.randint(100, 100000)) / 100,
+                barcode=f"{BENCH_PREFIX}{seed:02d}{i:010d}",
+                quantity=rng.randint(0, 500), reorder_level=rng.randint(5, 50),
+                expiry_date=anchor + timedelta(days=rng.randint(-30, 365)) if has_expiry else None,
+            )
+
+    phase('products')
+    # (pk, price, quantity on hand) per product; movements refer to list indexes
+    catalogue = []
+    for batch in batched(product_rows(), batch_size):
+        with transaction.atomic():
+            catalogue.extend((p.pk, p.price, p.quantity) for p in Product.objects.bulk_create(batch))
+    done('products', 'products', len(catalogue))
+
+    # Stock leaving and entering each product after the initial stock movement
+    removed = [0] * len(catalogue)
+    added = [0] * len(catalogue)
+
+    def sale_rows():
+        for _ in range(sales):
+            lines = [(rng.randrange(len(catalogue)), rng.randint(1, 5)) for _ in range(rng.randint(1, items_per_sale))]
+            total = sum(catalogue[index][1] * quantity for index, quantity in lines)
+            sale = Sale(
+                customer_name=BENCH_CUSTOMER, customer_email='', customer_phone='',
+                date=random_date(), total_amount=total, created_by=user,
+            )
+            yield sale, lines
+
+    phase('sales')
+    item_count = 0
+    with explicit_dates(Sale, StockMovement):
+        for batch in batched(sale_rows(), batch_size):
+            with transaction.atomic():
+                created = Sale.objects.bulk_create([sale for sale, _ in batch])
+                items, outs = [], []
+                for sale, (_, lines) in zip(created, batch):
+                    for index, quantity in lines:
+                        product_id, price, _ = catalogue[index]
+                        removed[index] += quantity
+                        items.append(SaleItem(sale_id=sale.pk, product_id=product_id, quantity=quantity, price=price))
+                        outs.append(StockMovement(
+                            product_id=product_id, movement_type='out', quantity=quantity,
+                            notes=f"Sold in sale #{sale.pk}", created_by=user, date=sale.date,
+                        ))
+                SaleItem.objects.bulk_create(items)
+                StockMovement.objects.bulk_create(outs)
+            item_count += len(items)
+    done('sales', 'sales', sales)
+    counts['sale_items'] = item_count
+
+    def adjustment_rows():
+        for _ in range(movements):
+            index = rng.randrange(len(catalogue))
+            movement_type = rng.choice(['in', 'out'])
+            quantity = rng.randint(1, 50)
+            (added if movement_type == 'in' else removed)[index] += quantity
+            yield StockMovement(
+                product_id=catalogue[index][0], movement_type=movement_type,
+                quantity=quantity, notes='Stock adjustment', created_by=user, date=random_date(),
+            )
+
+    phase('adjustments')
+    with explicit_dates(StockMovement):
+        for batch in batched(adjustment_rows(), batch_size):
+            with transaction.atomic():
+                StockMovement.objects.bulk_create(batch)
+        # Stock adjusted in is still on hand at the end of the history
+        restocked = (
+            Product(pk=product_id, quantity=on_hand + added[index])
+            for index, (product_id, _, on_hand) in enumerate(catalogue) if added[index]
+        )
+        for batch in batched(restocked, batch_size):
+            with transaction.atomic():
+                Product.objects.bulk_update(batch, ['quantity'])
+    done('adjustments', 'adjustments', movements)
+
+    def initial_stock_rows():
+        # Enough stock to cover every later 'out' and still leave the seeded
+        # quantity on hand, so the running balance never goes negative
+        start = end - timedelta(seconds=span_seconds)
+        for index, (product_id, _, on_hand) in enumerate(catalogue):
+            if on_hand + removed[index]:
+                yield StockMovement(
+                    product_id=product_id, movement_type='in', quantity=on_hand + removed[index],
+                    notes='Initial stock', created_by=user, date=start,
+                )
+
+    phase('initial_stock')
+    initial_movements = 0
+    with explicit_dates(StockMovement):
+        for batch in batched(initial_stock_rows(), batch_size):
+            with transaction.atomic():
+                StockMovement.objects.bulk_create(batch)
+            initial_movements += len(batch)
+    done('initial_stock', 'initial_stock', initial_movements)
+    counts['stock_movements'] = initial_movements + item_count + movements
+
+    return {'counts': counts, 'timings_s': timings, 'anchor': anchor.isoformat()}
@@ -0,0 +1,42 @@
+"""
+Latency statistics shared by the benchmarks and the load generator.
+"""
+
+import time
+
+
+def percentile(sorted_values, pct):
+    """Return the pct-th percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(latencies, elapsed, errors=0):
+    """Summarize a list of latencies in seconds measured over `elapsed` seconds."""
+    latencies = sorted(latencies)
+    count = len(latencies)
+    return {
+        'count': count,
+        'errors': errors,
+        'elapsed_s': round(elapsed, 3),
+        'throughput_rps': round(count / elapsed, 1) if elapsed else 0.0,
+        'mean_ms': round(sum(latencies) / count * 1000, 3) if count else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def time_calls(func, iterations, warmup=0):
+    """Call func() repeatedly and summarize how long each call took."""
+    for _ in range(warmup):
+        func()
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - call_started)
+    return summarize(latencies, time.perf_counter() - started)
@@ -30,6 +30,14 @@ if %ERRORLEVEL% NEQ 0 (
 )
 echo.
 
+echo === COMPILING TRANSLATIONS ===
+python compile_translations.py
+if %ERRORLEVEL% NEQ 0 (
+    echo ERROR: Translation catalogs are invalid or incomplete
+    exit /b %ERRORLEVEL%
+)
+echo.
+
 echo === COLLECTING STATIC FILES ===
 python manage.py collectstatic --noinput
 if %ERRORLEVEL% NEQ 0 (
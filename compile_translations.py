@@ -1,15 +1,93 @@
 #!/usr/bin/env python3
 """
 Script to compile .po files to .mo files using polib
+
+Compilation is incremental: the SHA-256 of every compiled .po file is stored in
+locale/.compiled_catalogs.json and catalogs whose .po did not change are skipped.
+Catalogs with fuzzy or untranslated entries fail the run, so a half-translated
+language never reaches a deployment. --check does not use the manifest; it
+compares the messages in each .mo with its .po, so it also works on a fresh
+clone.
+
+Usage:
+    python compile_translations.py              # compile changed catalogs
+    python compile_translations.py --force      # recompile every catalog
+    python compile_translations.py --check      # verify .mo files are current and loadable
+    python compile_translations.py --allow-incomplete  # report problems without failing
 """
+import argparse
+import gettext
+import hashlib
+import json
 import os
+import sys
 import polib
 
-def compile_po_to_mo(po_file_path):
+MANIFEST_NAME = '.compiled_catalogs.json'
+
+# The msgids are written in English, so empty msgstr values are expected there
+# and Django falls back to the msgid.
+SOURCE_LANGUAGES = {'en'}
+
+
+def file_hash(path):
+    """Return the SHA-256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(locale_dir):
+    """Load the hashes of the .po files compiled by the previous run"""
+    try:
+        with open(os.path.join(locale_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(locale_dir, manifest):
+    """Store the hashes of the compiled .po files"""
+    with open(os.path.join(locale_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def find_catalogs(locale_dir):
+    """Yield (language, po_file_path) for every language with a django.po file"""
+    for lang_dir in sorted(os.listdir(locale_dir)):
+        lang_path = os.path.join(locale_dir, lang_dir)
+        if os.path.isdir(lang_path):
+            lc_messages_path = os.path.join(lang_path, 'LC_MESSAGES')
+            if os.path.exists(lc_messages_path):
+                po_file = os.path.join(lc_messages_path, 'django.po')
+                if os.path.exists(po_file):
+                    yield lang_dir, po_file
+                else:
+                    print(f"No django.po file found in {lc_messages_path}")
+
+
+def mo_path_for(po_file_path):
+    """Return the .mo path that belongs to a .po file"""
+    return os.path.splitext(po_file_path)[0] + '.mo'
+
+
+def validate_po(po, language):
+    """Return a list of problems that would make the compiled catalog incomplete"""
+    problems = [f"fuzzy entry: {entry.msgid!r}" for entry in po.fuzzy_entries()]
+    if language not in SOURCE_LANGUAGES:
+        problems += [f"missing translation: {entry.msgid!r}" for entry in po.untranslated_entries()]
+    return problems
+
+
+def compile_po_to_mo(po_file_path, po=None):
     """Compile a .po file to a .mo file"""
     try:
-        po = polib.pofile(po_file_path)
-        mo_file_path = po_file_path.replace('.po', '.mo')
+        if po is None:
+            po = polib.pofile(po_file_path)
+        mo_file_path = mo_path_for(po_file_path)
         po.save_as_mofile(mo_file_path)
         print(f"Compiled {po_file_path} -> {mo_file_path}")
         return True
@@ -17,25 +95,107 @@ def compile_po_to_mo(po_file_path):
         print(f"Error compiling {po_file_path}: {e}")
         return False
 
+
+def catalog_messages(entries):
+    """Return the translations of catalog entries, keyed by context, msgid and plural"""
+    messages = {}
+    for entry in entries:
+        if entry.msgid:
+            translation = tuple(sorted(entry.msgstr_plural.items())) if entry.msgid_plural else entry.msgstr
+            messages[(entry.msgctxt, entry.msgid, entry.msgid_plural)] = translation
+    return messages
+
+
+def mo_matches_po(po_file_path):
+    """Check that the .mo file holds exactly the translations of its .po file"""
+    mo_file_path = mo_path_for(po_file_path)
+    if not os.path.exists(mo_file_path):
+        print(f"Missing {mo_file_path} (run compile_translations.py)")
+        return False
+    try:
+        po = polib.pofile(po_file_path)
+        mo = polib.mofile(mo_file_path)
+    except Exception as e:
+        print(f"Error reading {po_file_path} or {mo_file_path}: {e}")
+        return False
+    # A .mo file only holds the translated entries of its .po file
+    if catalog_messages(po.translated_entries()) != catalog_messages(mo):
+        print(f"Out of date: {mo_file_path} (run compile_translations.py)")
+        return False
+    return True
+
+
+def check_mo(mo_file_path):
+    """Check that a .mo file exists and can be loaded by gettext"""
+    try:
+        with open(mo_file_path, 'rb') as f:
+            gettext.GNUTranslations(f)
+        return True
+    except (OSError, gettext.error) as e:
+        print(f"Invalid catalog {mo_file_path}: {e}")
+        return False
+
+
 def main():
     """Main function to compile all .po files in the locale directory"""
-    locale_dir = os.path.join(os.path.dirname(__file__), 'locale')
-    
+    parser = argparse.ArgumentParser(description='Compile locale/*/LC_MESSAGES/django.po to .mo files')
+    parser.add_argument('--force', action='store_true', help='Recompile catalogs even if unchanged')
+    parser.add_argument('--check', action='store_true',
+                        help='Only verify that every .mo is up to date and loadable')
+    parser.add_argument('--allow-incomplete', action='store_true',
+                        help='Report fuzzy or missing entries without failing')
+    args = parser.parse_args()
+
+    locale_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'locale')
+
     if not os.path.exists(locale_dir):
         print(f"Locale directory not found: {locale_dir}")
-        return
-    
+        return 0
+
+    manifest = load_manifest(locale_dir)
+    failed = False
+
     # Walk through all language directories
-    for lang_dir in os.listdir(locale_dir):
-        lang_path = os.path.join(locale_dir, lang_dir)
-        if os.path.isdir(lang_path):
-            lc_messages_path = os.path.join(lang_path, 'LC_MESSAGES')
-            if os.path.exists(lc_messages_path):
-                po_file = os.path.join(lc_messages_path, 'django.po')
-                if os.path.exists(po_file):
-                    compile_po_to_mo(po_file)
-                else:
-                    print(f"No django.po file found in {lc_messages_path}")
+    for language, po_file in find_catalogs(locale_dir):
+        mo_file = mo_path_for(po_file)
+
+        if args.check:
+            if mo_matches_po(po_file) and check_mo(mo_file):
+                print(f"OK {mo_file}")
+            else:
+                failed = True
+            continue
+
+        po_hash = file_hash(po_file)
+        if manifest.get(language) == po_hash and os.path.exists(mo_file) and not args.force:
+            print(f"Unchanged {po_file}, skipping")
+            continue
+
+        try:
+            po = polib.pofile(po_file)
+        except Exception as e:
+            print(f"Error parsing {po_file}: {e}")
+            failed = True
+            continue
+
+        problems = validate_po(po, language)
+        for problem in problems:
+            print(f"{po_file}: {problem}")
+        if problems and not args.allow_incomplete:
+            print(f"Not compiling {po_file}: {len(problems)} problem(s)")
+            failed = True
+            continue
+
+        if compile_po_to_mo(po_file, po) and check_mo(mo_file):
+            # Incomplete catalogs are not recorded so a strict run checks them again
+            if not problems:
+                manifest[language] = po_hash
+        else:
+            failed = True
+
+    if not args.check:
+        save_manifest(locale_dir, manifest)
+    return 1 if failed else 0
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""
+Gunicorn production profile for the Inventory Management System.
+
+Gunicorn loads ./gunicorn.conf.py automatically; start_gunicorn.py, the Procfile
+and render.yaml also pass it explicitly with --config.
+
+Every setting can be overridden through environment variables so the same file
+works on the Render free tier and on larger hosts:
+
+    PORT                       Port to bind (default: 8000)
+    WEB_CONCURRENCY            Number of worker processes (default: autotuned)
+    GUNICORN_THREADS           Threads per gthread worker (default: autotuned)
+    GUNICORN_WORKER_MEMORY_MB  Expected RSS of one worker, used for autotuning (default: 150)
+    GUNICORN_TIMEOUT           Worker timeout in seconds (default: 120)
+    GUNICORN_KEEPALIVE         Keep-alive timeout in seconds (default: 2)
+    GUNICORN_MAX_REQUESTS      Recycle a worker after this many requests (default: 1000)
+    GUNICORN_MAX_REQUESTS_JITTER  Random jitter added to max_requests (default: 100)
+    GUNICORN_LOG_LEVEL         Log level (default: info)
+"""
+
+import gettext
+import os
+import sys
+import time
+
+if sys.platform != 'win32':
+    import resource
+
+# Cgroup files that hold the container memory limit (v2 first, then v1)
+CGROUP_MEMORY_LIMIT_FILES = [
+    '/sys/fs/cgroup/memory.max',
+    '/sys/fs/cgroup/memory/memory.limit_in_bytes',
+]
+
+
+def _env_int(name, default):
+    """Read an integer from the environment, falling back to the default."""
+    value = os.environ.get(name, '').strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        print(f"[gunicorn.conf] Ignoring invalid {name}={value!r}, using {default}")
+        return default
+
+
+def _cpu_count():
+    """Return the number of CPUs this process may actually run on."""
+    if sys.platform == 'linux':
+        try:
+            return len(os.sched_getaffinity(0))
+        except OSError:
+            pass
+    return os.cpu_count() or 1
+
+
+def _memory_limit_bytes():
+    """Return the container memory limit in bytes, or None when unlimited."""
+    for path in CGROUP_MEMORY_LIMIT_FILES:
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        if value.isdigit():
+            limit = int(value)
+            # cgroup v1 reports "unlimited" as a huge page-aligned number
+            if limit < 1 << 60:
+                return limit
+    return None
+
+
+def _current_rss_mb():
+    """Return the resident set size of the current process in MB."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if sys.platform == 'win32':
+        return 0.0
+    # ru_maxrss is the peak, which is close enough here; it is in bytes on
+    # macOS and in KB elsewhere
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return peak / 1024 if sys.platform == 'darwin' else peak
+
+
+def _autotune_workers(cpus, memory_limit, worker_memory_mb):
+    """Pick a worker count from the CPU count, capped by the memory limit."""
+    workers = 2 * cpus + 1
+    if memory_limit is not None:
+        # Keep one worker's worth of memory for the master and the preloaded app
+        by_memory = memory_limit // (worker_memory_mb * 1024 * 1024) - 1
+        workers = min(workers, by_memory)
+    return max(1, workers)
+
+
+_cpus = _cpu_count()
+_memory_limit = _memory_limit_bytes()
+_worker_memory_mb = _env_int('GUNICORN_WORKER_MEMORY_MB', 150)
+
+# Server socket
+bind = f"0.0.0.0:{_env_int('PORT', 8000)}"
+
+# Worker processes. Views mostly wait on the database and SMTP, so a few
+# processes with several threads each serve more requests per MB than many
+# sync processes.
+workers = _env_int('WEB_CONCURRENCY', _autotune_workers(_cpus, _memory_limit, _worker_memory_mb))
+worker_class = 'gthread'
+threads = _env_int('GUNICORN_THREADS', max(2, min(8, 2 * _cpus)))
+timeout = _env_int('GUNICORN_TIMEOUT', 120)
+graceful_timeout = 30
+keepalive = _env_int('GUNICORN_KEEPALIVE', 2)
+
+# Import Django once in the master so workers share its memory copy-on-write
+preload_app = True
+
+# Recycle workers periodically so slow memory growth cannot accumulate. The
+# jitter keeps all workers from restarting at the same moment.
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _env_int('GUNICORN_MAX_REQUESTS_JITTER', 100)
+
+# Heartbeat files on tmpfs so a slow disk cannot make workers look hung
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+# Logging
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+_started_at = time.monotonic()
+
+
+def _warm_translation_catalogs(server):
+    """Load every compiled .mo catalog in the master so workers inherit them.
+
+    Django silently falls back to the default language when a catalog is
+    missing, so each LANGUAGES entry is checked for a loadable django.mo under
+    LOCALE_PATHS first and problems are logged as errors.
+    """
+    try:
+        from django.conf import settings
+        from django.utils.translation import to_locale, trans_real
+    except ImportError:
+        return
+    if not settings.configured:
+        return
+    for code, _ in settings.LANGUAGES:
+        catalogs = [
+            os.path.join(str(path), to_locale(code), 'LC_MESSAGES', 'django.mo')
+            for path in settings.LOCALE_PATHS
+        ]
+        catalog = next((path for path in catalogs if os.path.exists(path)), None)
+        if catalog is None:
+            server.log.error("No compiled django.mo for %s in LOCALE_PATHS", code)
+            continue
+        try:
+            with open(catalog, 'rb') as f:
+                gettext.GNUTranslations(f)
+            trans_real.translation(code)
+        except Exception as e:
+            server.log.error("Could not load the %s translation catalog %s: %s", code, catalog, e)
+
+
+def when_ready(server):
+    """Log the resolved profile once the master has preloaded the application."""
+    _warm_translation_catalogs(server)
+    memory = f"{_memory_limit // (1024 * 1024)} MB" if _memory_limit else 'unlimited'
+    server.log.info(
+        "Profile: %d workers x %d threads (%s), %d CPUs, memory limit %s, "
+        "app preloaded in %.2fs, master RSS %.1f MB",
+        workers, threads, worker_class, _cpus, memory,
+        time.monotonic() - _started_at, _current_rss_mb(),
+    )
+
+
+def post_fork(server, worker):
+    """Drop database connections inherited from the master process."""
+    worker.forked_at = time.monotonic()
+    try:
+        from django.db import connections
+    except ImportError:
+        return
+    # Sockets opened while preloading must not be shared between processes
+    connections.close_all()
+
+
+def post_worker_init(worker):
+    """Log how long the worker took to start and how much memory it uses."""
+    started = getattr(worker, 'forked_at', _started_at)
+    worker.log.info(
+        "Worker %s ready in %.3fs, RSS %.1f MB",
+        worker.pid, time.monotonic() - started, _current_rss_mb(),
+    )
+
+
+def worker_exit(server, worker):
+    """Log the memory a worker held when it was recycled or stopped."""
+    server.log.info("Worker %s exiting, RSS %.1f MB", worker.pid, _current_rss_mb())
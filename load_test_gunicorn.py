@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Load test comparing the legacy Gunicorn command line with the gunicorn.conf.py profile.
+
+Each profile is started on the same machine, one after the other, and driven
+with the same number of concurrent keep-alive clients from benchmarks.loadgen,
+so results use the same keys as `python -m benchmarks load`. The script reports
+startup time, latency percentiles, throughput and the memory held by the
+whole Gunicorn process tree. Memory is read from /proc, so it is reported as
+n/a on systems without it, such as macOS.
+
+Usage:
+    python load_test_gunicorn.py [--path /en/] [--requests 2000] [--concurrency 16]
+"""
+
+import argparse
+import http.client
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks import loadgen
+
+HOST = '127.0.0.1'
+
+# The command line used by start_gunicorn.py before gunicorn.conf.py existed.
+# It is run with an empty --config, because Gunicorn would otherwise pick up
+# ./gunicorn.conf.py on its own and the legacy run would get the new profile.
+LEGACY_ARGS = ['--workers', '3', '--timeout', '120', '--keep-alive', '2']
+TUNED_ARGS = ['--config', 'gunicorn.conf.py']
+
+
+def process_tree(root_pid):
+    """Return the PIDs of root_pid and all of its descendants, or None without /proc."""
+    try:
+        entries = os.listdir('/proc')
+    except OSError:
+        return None
+    children = {}
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # The command name may contain spaces, so split after ')'
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    pids, stack = [], [root_pid]
+    while stack:
+        pid = stack.pop()
+        pids.append(pid)
+        stack.extend(children.get(pid, []))
+    return pids
+
+
+def tree_memory_mb(root_pid):
+    """Return the memory of a process tree in MB, or None without /proc.
+
+    PSS is used where available because it splits pages shared after a
+    preloaded fork between the processes instead of counting them once per
+    worker, which is what plain RSS would do.
+    """
+    pids = process_tree(root_pid)
+    if pids is None:
+        return None
+    total_kb = 0
+    for pid in pids:
+        for path, key in ((f'/proc/{pid}/smaps_rollup', 'Pss:'), (f'/proc/{pid}/status', 'VmRSS:')):
+            try:
+                with open(path) as f:
+                    value = next((line.split()[1] for line in f if line.startswith(key)), None)
+            except OSError:
+                continue
+            if value is not None:
+                total_kb += int(value)
+                break
+    return round(total_kb / 1024, 1)
+
+
+def wait_until_ready(port, path, proc, timeout):
+    """Poll the server until it answers, returning the time it took."""
+    started = time.monotonic()
+    while time.monotonic() - started < timeout:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Gunicorn exited with code {proc.returncode} during startup")
+        try:
+            conn = http.client.HTTPConnection(HOST, port, timeout=5)
+            conn.request('GET', path)
+            conn.getresponse().read()
+            conn.close()
+            return time.monotonic() - started
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Server on port {port} was not ready after {timeout}s")
+
+
+def stop_server(proc):
+    """Stop the Gunicorn master and every worker it started."""
+    if sys.platform == 'win32':
+        proc.kill()
+        proc.wait()
+        return
+    os.killpg(proc.pid, signal.SIGTERM)
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        os.killpg(proc.pid, signal.SIGKILL)
+        proc.wait()
+
+
+def benchmark_profile(name, extra_args, args):
+    """Start Gunicorn with one profile, load it and shut it down again."""
+    cmd = ['gunicorn', *extra_args, '--bind', f'{HOST}:{args.port}', args.app]
+    print(f"\n=== {name} ===")
+    print(f"Command: {' '.join(cmd)}")
+
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=None if args.verbose else subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    try:
+        startup = wait_until_ready(args.port, args.path, proc, args.startup_timeout)
+        request = loadgen.http_requester(f'http://{HOST}:{args.port}', args.path)
+        # Warm every worker with concurrent requests before measuring
+        loadgen.run(request, args.concurrency * 4, args.concurrency, warmup=0)
+        result = loadgen.run(request, args.requests, args.concurrency, warmup=0)
+        result['startup_s'] = round(startup, 3)
+        result['memory_mb'] = tree_memory_mb(proc.pid)
+    finally:
+        stop_server(proc)
+
+    for key, value in result.items():
+        print(f"  {key}: {value}")
+    return result
+
+
+def print_comparison(results):
+    """Print both profiles side by side."""
+    legacy, tuned = results['legacy'], results['tuned']
+    print("\n=== COMPARISON ===")
+    print(f"{'metric':<16}{'legacy':>12}{'tuned':>12}")
+    for key in ('startup_s', 'throughput_rps', 'p50_ms', 'p95_ms', 'p99_ms', 'memory_mb', 'errors'):
+        before, after = ('n/a' if value is None else value for value in (legacy[key], tuned[key]))
+        print(f"{key:<16}{before:>12}{after:>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--app', default='app:application', help='WSGI application to serve')
+    parser.add_argument('--path', default='/', help='URL path to request')
+    parser.add_argument('--port', type=int, default=8765, help='Port used for both runs')
+    parser.add_argument('--requests', type=int, default=2000, help='Requests per profile')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent clients')
+    parser.add_argument('--startup-timeout', type=float, default=60, help='Seconds to wait for startup')
+    parser.add_argument('--json', help='Also write the results to this file')
+    parser.add_argument('--verbose', action='store_true', help='Show Gunicorn logs')
+    args = parser.parse_args()
+
+    if sys.platform == 'win32':
+        print("Gunicorn is not available on Windows; run this script on Linux or macOS.")
+        sys.exit(1)
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False) as empty_config:
+        empty_config.write('# Intentionally empty: run Gunicorn with its built-in defaults\n')
+
+    results = {}
+    try:
+        legacy_args = ['--config', empty_config.name, *LEGACY_ARGS]
+        results['legacy'] = benchmark_profile('Legacy profile', legacy_args, args)
+        results['tuned'] = benchmark_profile('gunicorn.conf.py profile', TUNED_ARGS, args)
+    except RuntimeError as e:
+        print(f"Error running load test: {e}")
+        sys.exit(1)
+    finally:
+        os.remove(empty_config.name)
+
+    print_comparison(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,4 +4,4 @@ echo Server will be available at http://0.0.0.0:8000
 echo Press Ctrl+C to stop the server
 echo.
 
-gunicorn --bind 0.0.0.0:8000 --workers 3 --timeout 120 --keep-alive 2 inventory_management.wsgi:application
\ No newline at end of file
+gunicorn --config gunicorn.conf.py inventory_management.wsgi:application
\ No newline at end of file
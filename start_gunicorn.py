@@ -16,19 +16,19 @@ def run_gunicorn():
     # Change to the project directory
     os.chdir(project_dir)
     
-    # Gunicorn command
+    # Gunicorn command. Workers, threads, timeouts and recycling are
+    # configured in gunicorn.conf.py and can be overridden with environment
+    # variables (see the top of that file).
     cmd = [
         'gunicorn',
-        '--bind', '0.0.0.0:8000',
-        '--workers', '3',
-        '--timeout', '120',
-        '--keep-alive', '2',
+        '--config', 'gunicorn.conf.py',
         'inventory_management.wsgi:application'
     ]
+    port = os.environ.get('PORT', '8000')
     
     print("Starting Inventory Management System with Gunicorn...")
     print(f"Command: {' '.join(cmd)}")
-    print("Server will be available at http://0.0.0.0:8000")
+    print(f"Server will be available at http://0.0.0.0:{port}")
     print("Press Ctrl+C to stop the server")
     
     # Run Gunicorn
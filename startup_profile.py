@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Profile the cold start of the WSGI application.
+
+Imports `app:application` in a fresh interpreter started with `-X importtime`
+and reports the wall time, peak memory and the modules that cost the most,
+both individually (cumulative time) and grouped by top-level package.
+
+Usage:
+    python startup_profile.py [--top 25] [--json startup.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+project_dir = Path(__file__).resolve().parent
+
+# Libraries that are only needed by individual views or commands and must not
+# be pulled in by importing the WSGI application.
+HEAVY_MODULES = ['qrcode', 'PIL', 'reportlab', 'openpyxl', 'xlsxwriter', 'numpy', 'pandas']
+
+# Runs in the child interpreter; prints a JSON summary on the last stdout line
+CHILD_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+from app import application
+elapsed = time.perf_counter() - started
+try:
+    import resource
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    if sys.platform == 'darwin':
+        peak_rss_mb /= 1024
+except ImportError:
+    peak_rss_mb = None
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{
+    'elapsed_s': elapsed,
+    'peak_rss_mb': peak_rss_mb,
+    'module_count': len(sys.modules),
+    'heavy_modules_loaded': heavy,
+}}))
+"""
+
+
+def parse_importtime(stderr):
+    """Parse `-X importtime` output into (module, self_us, cumulative_us, depth) tuples."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+            module = name.strip()
+            # One separator space, then two spaces per nesting level
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            entries.append((module, int(self_us), int(cumulative_us), depth))
+        except ValueError:
+            continue
+    return entries
+
+
+def measure_startup(importtime=False):
+    """Import the application in a fresh interpreter and return its measurements."""
+    env = dict(os.environ)
+    env.setdefault('DJANGO_SETTINGS_MODULE', 'inventory_management.settings')
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ['-X', 'importtime']
+    cmd += ['-c', CHILD_SCRIPT.format(heavy=HEAVY_MODULES)]
+
+    result = subprocess.run(cmd, cwd=project_dir, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing app:application failed:\n{result.stderr[-2000:]}")
+
+    summary = json.loads(result.stdout.strip().splitlines()[-1])
+    if importtime:
+        summary['imports'] = parse_importtime(result.stderr)
+    return summary
+
+
+def summarize_packages(imports):
+    """Sum the self time of every module per top-level package."""
+    packages = {}
+    for module, self_us, _, _ in imports:
+        package = module.split('.', 1)[0]
+        packages[package] = packages.get(package, 0) + self_us
+    return sorted(packages.items(), key=lambda item: item[1], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--top', type=int, default=25, help='Number of modules/packages to show')
+    parser.add_argument('--json', help='Also write the full profile to this file')
+    args = parser.parse_args()
+
+    print("=== STARTUP PROFILE: from app import application ===")
+    try:
+        summary = measure_startup(importtime=True)
+    except RuntimeError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    imports = summary['imports']
+    print(f"Wall time:     {summary['elapsed_s']:.3f}s")
+    if summary['peak_rss_mb'] is not None:
+        print(f"Peak RSS:      {summary['peak_rss_mb']:.1f} MB")
+    print(f"Modules:       {summary['module_count']}")
+    heavy = summary['heavy_modules_loaded']
+    print(f"Heavy modules: {', '.join(heavy) if heavy else 'none'}")
+
+    print(f"\n=== TOP {args.top} MODULES BY CUMULATIVE TIME ===")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    by_cumulative = sorted(imports, key=lambda entry: entry[2], reverse=True)
+    for module, self_us, cumulative_us, depth in by_cumulative[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {'  ' * depth}{module}")
+
+    print(f"\n=== TOP {args.top} PACKAGES BY SELF TIME ===")
+    for package, self_us in summarize_packages(imports)[:args.top]:
+        print(f"{self_us / 1000:>14.1f}  {package}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(summary, f, indent=2)
+        print(f"\nProfile written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
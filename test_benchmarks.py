@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Smoke test for the benchmark statistics and regression comparison.
+
+`python -m benchmarks compare` decides its exit status from these functions,
+so the percentile maths and the direction of each metric are checked here.
+Runs with pytest or directly as a script.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project directory to Python path
+project_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(project_dir))
+
+from benchmarks.results import compare
+from benchmarks.stats import percentile, summarize
+
+
+def make_run(**metrics):
+    """Build a minimal result file with one benchmark."""
+    return {'results': {'dashboard': metrics}}
+
+
+def test_percentile():
+    """Percentiles pick the nearest rank of a sorted list."""
+    values = [i / 100 for i in range(1, 101)]
+    assert percentile([], 50) == 0.0
+    assert percentile([0.5], 99) == 0.5
+    assert percentile(values, 0) == 0.01
+    assert percentile(values, 50) == 0.51
+    assert percentile(values, 99) == 0.99
+    assert percentile(values, 100) == 1.0
+
+
+def test_summarize():
+    """Latencies in seconds are summarized in milliseconds."""
+    result = summarize([0.003, 0.001, 0.002, 0.004], elapsed=2.0, errors=1)
+    assert result['count'] == 4
+    assert result['errors'] == 1
+    assert result['throughput_rps'] == 2.0
+    assert result['mean_ms'] == 2.5
+    assert result['p50_ms'] == 3.0
+    assert result['p99_ms'] == 4.0
+
+    empty = summarize([], elapsed=0)
+    assert empty['count'] == 0
+    assert empty['throughput_rps'] == 0.0
+    assert empty['p50_ms'] == 0.0
+
+
+def test_compare_latency_direction():
+    """Higher latency is a regression, lower latency is not."""
+    baseline = make_run(p50_ms=10.0, p95_ms=20.0, p99_ms=30.0)
+
+    _, regressions = compare(baseline, make_run(p50_ms=12.0, p95_ms=20.0, p99_ms=30.0), threshold=10)
+    assert [(name, metric) for name, metric, *_ in regressions] == [('dashboard', 'p50_ms')]
+
+    _, regressions = compare(baseline, make_run(p50_ms=5.0, p95_ms=10.0, p99_ms=15.0), threshold=10)
+    assert regressions == []
+
+    # Changes within the threshold are not flagged
+    _, regressions = compare(baseline, make_run(p50_ms=10.9, p95_ms=21.0, p99_ms=32.0), threshold=10)
+    assert regressions == []
+
+
+def test_compare_throughput_direction():
+    """Lower throughput is a regression, higher throughput is not."""
+    baseline = make_run(throughput_rps=100.0)
+
+    rows, regressions = compare(baseline, make_run(throughput_rps=80.0), threshold=10)
+    assert rows == [('dashboard', 'throughput_rps', 100.0, 80.0, -20.0)]
+    assert len(regressions) == 1
+
+    _, regressions = compare(baseline, make_run(throughput_rps=150.0), threshold=10)
+    assert regressions == []
+
+
+def test_compare_skips_missing_benchmarks():
+    """Benchmarks or metrics missing from one side are not compared."""
+    baseline = {'results': {'dashboard': {'p50_ms': 10.0}, 'checkout': {'p50_ms': 5.0}}}
+    current = {'results': {'dashboard': {'p95_ms': 50.0}}}
+    rows, regressions = compare(baseline, current)
+    assert rows == []
+    assert regressions == []
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith('test_')]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+    if failed:
+        print(f"\n✗ {failed} of {len(tests)} tests failed.")
+        sys.exit(1)
+    print(f"\n✓ All {len(tests)} tests passed!")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Regression test for the cold start of the WSGI application.
+
+Fails when `from app import application` takes longer or uses more memory than
+the configured budget, or when it imports libraries that should only be loaded
+lazily by the views and commands that use them (qrcode, Pillow, report writers).
+
+Budgets can be adjusted with environment variables:
+    STARTUP_TIME_BUDGET_S     (default: 3.0)
+    STARTUP_MEMORY_BUDGET_MB  (default: 120)
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add the project directory to Python path
+project_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(project_dir))
+
+from startup_profile import measure_startup
+
+TIME_BUDGET_S = float(os.environ.get('STARTUP_TIME_BUDGET_S', '3.0'))
+MEMORY_BUDGET_MB = float(os.environ.get('STARTUP_MEMORY_BUDGET_MB', '120'))
+# Runs are noisy on shared hosts; the best of a few runs is compared to the budget
+RUNS = 3
+
+
+def check_startup_budget():
+    """Import the application in fresh interpreters and return the budget violations.
+
+    Raises RuntimeError when `from app import application` fails.
+    """
+    print("Testing WSGI application startup budget...")
+    print(f"Budget: {TIME_BUDGET_S:.2f}s, {MEMORY_BUDGET_MB:.0f} MB")
+
+    runs = [measure_startup() for _ in range(RUNS)]
+    failures = []
+
+    elapsed = min(run['elapsed_s'] for run in runs)
+    if elapsed <= TIME_BUDGET_S:
+        print(f"✓ Import time {elapsed:.3f}s is within budget")
+    else:
+        failures.append(f"Import time {elapsed:.3f}s exceeds budget of {TIME_BUDGET_S:.2f}s")
+
+    rss_values = [run['peak_rss_mb'] for run in runs if run['peak_rss_mb'] is not None]
+    if not rss_values:
+        print("- Peak RSS not available on this platform, skipping memory check")
+    elif min(rss_values) <= MEMORY_BUDGET_MB:
+        print(f"✓ Peak RSS {min(rss_values):.1f} MB is within budget")
+    else:
+        failures.append(f"Peak RSS {min(rss_values):.1f} MB exceeds budget of {MEMORY_BUDGET_MB:.0f} MB")
+
+    heavy = runs[0]['heavy_modules_loaded']
+    if heavy:
+        failures.append(
+            f"Heavy modules imported at startup: {', '.join(heavy)} "
+            "(import them inside the views or commands that need them instead)"
+        )
+    else:
+        print("✓ No heavy optional modules imported at startup")
+
+    for failure in failures:
+        print(f"✗ {failure}")
+    return failures
+
+
+def test_startup_budget():
+    """Fail when the application import fails or goes over the budget."""
+    failures = check_startup_budget()
+    assert not failures, "Startup budget exceeded:\n" + "\n".join(failures)
+
+if __name__ == "__main__":
+    try:
+        failures = check_startup_budget()
+    except RuntimeError as e:
+        print(f"✗ {e}")
+        print("\n✗ Could not import the application; the budget was not checked.")
+        sys.exit(1)
+    if failures:
+        print("\nRun `python startup_profile.py` to see which modules cost the most.")
+        print("\n✗ Startup budget exceeded.")
+        sys.exit(1)
+    print("\n✓ Startup is within budget!")